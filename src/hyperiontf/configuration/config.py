@@ -1,4 +1,3 @@
-from hyperiontf.helpers.decorators.singleton import Singleton
 from hyperiontf.helpers.string_helpers import camel_to_snake_case
 from hyperiontf.configuration.sections import (
     Logger,
@@ -13,8 +12,15 @@ from hyperiontf.configuration.sections import Rest, MobileCapabilities
 
 import os
 
+# maps lower-cased file extension to the Config method which loads that format
+_CFG_FILE_LOADERS = {
+    "cfg": "_update_from_cfg_file",
+    "json": "_update_from_json_file",
+    "yml": "_update_from_yml_file",
+    "yaml": "_update_from_yml_file",
+}
+
 
-@Singleton
 class Config:
     """
     Represents the entire configuration.
@@ -22,18 +28,54 @@ class Config:
     This class holds instances of individual section classes and provides methods to
     load the configuration from different file formats (JSON, YAML) and initialize
     the config sections accordingly.
+
+    Sections are constructed lazily, on first access, and then stored as regular instance attributes.
+
+    The class is a singleton: ``Config()`` always returns the module level ``config`` instance.
     """
 
+    _instance = None
+    _initialized = False
+
+    _SECTIONS = {
+        "logger": Logger,
+        "page_object": PageObject,
+        "element": Element,
+        "web_capabilities": WebCapabilities,
+        "mobile_capabilities": MobileCapabilities,
+        "desktop_capabilities": DesktopCapabilities,
+        "rest": Rest,
+        "visual": Visual,
+        "cli": CLI,
+    }
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __init__(self):
-        self.logger = Logger()
-        self.page_object = PageObject()
-        self.element = Element()
-        self.web_capabilities = WebCapabilities()
-        self.mobile_capabilities = MobileCapabilities()
-        self.desktop_capabilities = DesktopCapabilities()
-        self.rest = Rest()
-        self.visual = Visual()
-        self.cli = CLI()
+        if self._initialized:
+            return
+        self._initialized = True
+        # parsed file contents keyed by path, each entry holds ((mtime_ns, size), data)
+        self._parsed_cache = {}
+
+    def __getattr__(self, name):
+        """
+        Instantiate a config section on first access.
+
+        Called only when regular attribute lookup fails, so once a section is created and stored on the instance,
+        subsequent accesses do not go through this method.
+        """
+        section_class = self._SECTIONS.get(name)
+        if section_class is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        section = section_class()
+        setattr(self, name, section)
+        return section
 
     def _parse_config_data(self, data):
         """
@@ -43,9 +85,14 @@ class Config:
             data (dict): Dictionary containing the configuration data.
 
         This method iterates over the data and updates the corresponding sections
-        in the configuration based on the section names and their data.
+        in the configuration based on the section names and their data. Empty files
+        and empty sections are skipped without touching the section instances.
         """
+        if not data:
+            return
         for section_name, section_data in data.items():
+            if not section_data:
+                continue
             section_name = camel_to_snake_case(section_name)
             _section_instance = getattr(self, section_name, None)
             if _section_instance:
@@ -56,51 +103,90 @@ class Config:
         Update the configuration from a cfg, JSON, or YAML file.
 
         Parameters:
-            cfg_file (str): Path to the cfg, JSON, or YAML file.
+            cfg_file (str | os.PathLike): Path to the cfg, JSON, or YAML file.
 
         This method reads the file, parses its contents, and updates the
         configuration sections accordingly.
         """
-        _, file_extension = os.path.splitext(cfg_file)
+        cfg_file = os.fspath(cfg_file)
+        loader = _CFG_FILE_LOADERS.get(cfg_file.rpartition(".")[2].lower())
+        if loader is not None:
+            getattr(self, loader)(cfg_file)
+
+    def invalidate_cache(self, cfg_file=None):
+        """
+        Drop cached parsed contents of configuration files.
 
-        if file_extension == ".cfg":
-            self._update_from_cfg_file(cfg_file)
-        elif file_extension == ".json":
-            self._update_from_json_file(cfg_file)
-        elif file_extension == ".yml" or file_extension == ".yaml":
-            self._update_from_yml_file(cfg_file)
+        Parameters:
+            cfg_file (str, optional): Path of the file to forget. When omitted, the whole cache is cleared.
+        """
+        if cfg_file is None:
+            self._parsed_cache.clear()
+        else:
+            self._parsed_cache.pop(cfg_file, None)
+
+    def _load_cached(self, cfg_file, loader):
+        """
+        Return parsed contents of the file, re-parsing it only when its mtime or size has changed.
+
+        Parameters:
+            cfg_file (str): Path to the configuration file.
+            loader (callable): Function which parses the file and returns a dictionary of sections.
+
+        Returns:
+            dict: Parsed configuration data.
+        """
+        stat = os.stat(cfg_file)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed_cache.get(cfg_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        data = loader(cfg_file)
+        self._parsed_cache[cfg_file] = (signature, data)
+        return data
 
     def _update_from_cfg_file(self, cfg_file):
+        self._parse_config_data(self._load_cached(cfg_file, self._read_cfg_file))
+
+    def _update_from_json_file(self, cfg_file):
+        self._parse_config_data(self._load_cached(cfg_file, self._read_json_file))
+
+    def _update_from_yml_file(self, cfg_file):
+        self._parse_config_data(self._load_cached(cfg_file, self._read_yml_file))
+
+    @staticmethod
+    def _read_cfg_file(cfg_file):
         import configparser
 
-        # Use configparser to read cfg file
+        with open(cfg_file, "r", encoding="utf-8") as cfg:
+            text = cfg.read()
+
+        # Use configparser to parse the already read cfg file contents
         config_parser = configparser.ConfigParser()
-        config_parser.read(cfg_file)
+        config_parser.read_string(text, source=cfg_file)
 
-        for section in config_parser.sections():
-            for key, value in config_parser[section].items():
-                # Update the section instance with key-value pair
-                section_instance = getattr(self, camel_to_snake_case(section), None)
-                if section_instance:
-                    section_instance.from_cfg_node({key: value})
+        return {
+            section: dict(proxy)
+            for section, proxy in config_parser.items()
+            if section != config_parser.default_section
+        }
 
-    def _update_from_json_file(self, cfg_file):
+    @staticmethod
+    def _read_json_file(cfg_file):
         with open(cfg_file, "r") as json_file:
             import json
 
             # Load JSON data from the file
-            data = json.load(json_file)
-            # Parse the data and update the sections
-            self._parse_config_data(data)
+            return json.load(json_file)
 
-    def _update_from_yml_file(self, cfg_file):
+    @staticmethod
+    def _read_yml_file(cfg_file):
         import yaml
 
         with open(cfg_file, "r") as yaml_file:
             # Load YAML data from the file
-            data = yaml.safe_load(yaml_file)
-            # Parse the data and update the sections
-            self._parse_config_data(data)
+            return yaml.safe_load(yaml_file)
 
 
 config = Config()
@@ -1,16 +1,60 @@
+from typing import Any, Optional
+
+
+def _resolve_class_attributes(cls) -> dict[str, Any]:
+    """
+    Collect the attributes defined along the class MRO, the first definition found wins, just like regular attribute
+    lookup.
+    """
+    resolved: dict[str, Any] = {}
+    for klass in cls.__mro__:
+        for key, value in vars(klass).items():
+            resolved.setdefault(key, value)
+    return resolved
+
+
+def _public_properties(cls) -> tuple:
+    """
+    Names of the public properties of the class, which are exposed as config fields.
+    """
+    return tuple(
+        key
+        for key, value in _resolve_class_attributes(cls).items()
+        if isinstance(value, property) and not key.startswith("_")
+    )
+
+
 class Section:
     """
     Base class for config sections.
     """
 
+    # attribute snapshot copied by to_dict, reset whenever a public attribute is assigned
+    _dict_cache: Optional[dict[str, Any]] = None
+
+    # public properties exposed as config fields, resolved once per class in __init_subclass__
+    _PROPERTY_FIELDS: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._PROPERTY_FIELDS = _public_properties(cls)
+
+    def __setattr__(self, key, value):
+        object.__setattr__(self, key, value)
+        if not key.startswith("_"):
+            object.__setattr__(self, "_dict_cache", None)
+
     def _iter_attributes(self):
         """
-        Iterate over attributes that are not callable and don't start with an underscore.
+        Iterate over public attributes: instance fields and properties declared on the section class.
+
+        Fields are taken straight from the instance ``__dict__`` and properties from the list classified when the
+        section class was created, so no MRO walk, sorting or ``callable`` probing is needed.
         """
-        for key in dir(self):
-            if key.startswith("_") or callable(getattr(self, key)):
-                continue
-            yield key
+        for key in vars(self):
+            if not key.startswith("_"):
+                yield key
+        yield from self._PROPERTY_FIELDS
 
     def from_cfg_node(self, cfg_node: dict):
         """
@@ -19,20 +63,36 @@ class Section:
         Parameters:
             cfg_node (dict): Dictionary containing configuration values.
 
-        This method iterates over the class attributes, excluding callable attributes and
-        those starting with an underscore (_), and updates them with the values from the
-        provided configuration node if they exist.
+        Only keys naming an existing public field or property of the section are applied, ``None`` values are
+        ignored. The loop walks the configuration node rather than every section field, so partial nodes cost only
+        as much as the keys they carry.
         """
-        for key in self._iter_attributes():
-            value = cfg_node.get(key)
-            if value is not None:
-                setattr(self, key, value)
+        if not cfg_node:
+            return
+        for key, value in cfg_node.items():
+            self._apply_cfg_value(key, value)
 
-    def to_dict(self) -> dict:
+    def _apply_cfg_value(self, key: str, value):
+        """
+        Assign a single configuration value, provided it is not ``None`` and names a public field or property.
+        """
+        if value is None or key.startswith("_"):
+            return
+        if key in vars(self) or key in self._PROPERTY_FIELDS:
+            setattr(self, key, value)
+
+    def to_dict(self) -> dict[str, Any]:
         """
         Convert the config section attributes to a dictionary.
 
+        The attribute values are collected once and cached until one of the section attributes is assigned, every call
+        returns a fresh copy of that snapshot, so callers are free to mutate it.
+
         Returns:
-            dict: A dictionary containing the config section attributes.
+            dict[str, Any]: A dictionary containing the config section attributes.
         """
-        return {key: getattr(self, key) for key in self._iter_attributes()}
+        data = self._dict_cache
+        if data is None:
+            data = {key: getattr(self, key) for key in self._iter_attributes()}
+            object.__setattr__(self, "_dict_cache", data)
+        return dict(data)
@@ -1,3 +1,6 @@
+import os
+from typing import Optional
+
 from ..section import Section
 
 
@@ -11,3 +14,34 @@ class Logger(Section):
         self.intercept_selenium_logs = True
         self.intercept_playwright_logs = True
         self.intercept_appium_logs = True
+        # absolute path of the log folder created last, so it is only created once per resolved location
+        self._ready_log_folder: Optional[str] = None
+
+    def ensure_log_folder_ready(self) -> str:
+        """
+        Resolve the configured log folder against the current working directory and create it if needed.
+
+        ``log_folder`` keeps the configured value as is, the resolution happens here on every call, so a change of
+        the working directory is honored, while the folder itself is only created once per resolved path.
+
+        Returns:
+            str: Absolute path of the log folder.
+        """
+        log_folder = self._resolve_log_folder(self.log_folder)
+        if log_folder != self._ready_log_folder:
+            os.makedirs(log_folder, exist_ok=True)
+            self._ready_log_folder = log_folder
+        return log_folder
+
+    @staticmethod
+    def _resolve_log_folder(value) -> str:
+        """
+        Convert the configured value into an absolute path, relative paths are resolved against the current
+        working directory.
+        """
+        path = str(value).strip()
+        if path.startswith("~"):
+            path = os.path.expanduser(path)
+        elif not os.path.isabs(path):
+            path = os.path.join(os.getcwd(), path)
+        return os.path.normpath(path)
@@ -1,6 +1,12 @@
 from ..section import Section
 from hyperiontf.typing import VisualMode, VisualModeType
 
+# normalized spelling -> interned VisualMode constant
+_VISUAL_MODES: dict[str, VisualModeType] = {
+    VisualMode.COLLECT: VisualMode.COLLECT,
+    VisualMode.COMPARE: VisualMode.COMPARE,
+}
+
 
 class Visual(Section):
     """
@@ -8,6 +14,22 @@ class Visual(Section):
     """
 
     def __init__(self):
-        self.mode: VisualModeType = VisualMode.COMPARE
+        self._mode: VisualModeType = VisualMode.COMPARE
         self.default_mismatch_threshold: float = 5.0
         self.default_partial_mismatch_threshold: float = 0.5
+
+    @property
+    def mode(self) -> VisualModeType:
+        """
+        Visual testing mode, always one of the ``VisualMode`` constants.
+        """
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: str):
+        mode = _VISUAL_MODES.get(str(value).strip().lower())
+        if mode is None:
+            raise ValueError(
+                f"Unknown visual mode '{value}', expected one of: {', '.join(_VISUAL_MODES)}"
+            )
+        self._mode = mode
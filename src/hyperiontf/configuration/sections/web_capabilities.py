@@ -1,6 +1,9 @@
 from ..capabilities import Capabilities
 import platform
 
+_BROWSER_BY_OS = {"Windows": "edge", "Linux": "firefox", "Darwin": "safari"}
+_DEFAULT_BROWSER = _BROWSER_BY_OS.get(platform.system(), "chrome")
+
 
 class WebCapabilities(Capabilities):
     """
@@ -17,15 +20,9 @@ class WebCapabilities(Capabilities):
         """
         Get the default browser based on the operating system.
 
+        The operating system is detected once, when the module is imported.
+
         Returns:
             str: The default browser name.
         """
-        os_name = platform.system()
-        if os_name == "Windows":
-            return "edge"
-        elif os_name == "Linux":
-            return "firefox"
-        elif os_name == "Darwin":
-            return "safari"
-        else:
-            return "chrome"
+        return _DEFAULT_BROWSER
@@ -1,5 +1,4 @@
 import pytest
-import types
 import inspect
 from hyperiontf.logging import getLogger
 
@@ -25,11 +24,10 @@ def fixture(
 
     Therefore, in order to correctly log and track these fixtures, the wrapper function
     in the decorator needs to be aware of the arguments of the original fixture function.
-    To dynamically handle this, we use Python's introspection capability to extract the
-    argument names from the original function and then build a new function via the 'exec'
-    function that has the same argument list. This way, the wrapper function will have the
-    same signature as the original function and pytest can correctly inject the required
-    fixtures.
+    To handle this, the wrapper accepts arbitrary keyword arguments and exposes the
+    original function's signature through ``__signature__``, which is what pytest
+    inspects to resolve the fixtures to inject. This way pytest sees the same argument
+    list as the original function and can correctly inject the required fixtures.
 
     Args:
         scope (str, optional): The scope of the fixture. Default is "function".
@@ -51,49 +49,51 @@ def fixture(
     """
 
     def inner_decorator(fixture_function):
-        # Get the names of the arguments to the original fixture function
-        sig = inspect.signature(fixture_function)
-        arg_names = ", ".join(sig.parameters.keys())
-
-        func_string = f"""
-@pytest.fixture(scope=scope, params=params, autouse=autouse, ids=ids, name=name)
-def wrapper({arg_names}):
-    # Custom logging logic to push the fixture name to the logger folder
-    if log:
-        logger.push_folder(fixture_function.__name__)
-
-    # Call the original fixture function with arguments
-    result = fixture_function({arg_names})
-
-    # Check if the fixture function returned a generator and get the result if so
-    while isinstance(result, types.GeneratorType):
-        result = next(result)
-
-    # Yield the result to the test function
-    result = yield result
-
-    # Custom logging logic to pop the fixture name from the logger folder
-    if log:
-        logger.pop_folder()
-
-    return result
-"""
-        evaluation_scope = {
-            "scope": scope,
-            "params": params,
-            "autouse": autouse,
-            "ids": ids,
-            "name": name,
-            "fixture_function": fixture_function,
-            "pytest": pytest,
-            "logger": logger,
-            "log": log,
-            "types": types,
-        }
-
-        # Use exec to create the function in the local namespace
-        local_namespace = {}
-        exec(func_string, evaluation_scope, local_namespace)
-        return local_namespace["wrapper"]
+        # Generator and plain fixtures get separate wrappers, chosen once at decoration time
+        if inspect.isgeneratorfunction(fixture_function):
+
+            def wrapper(*args, **kwargs):
+                # Custom logging logic to push the fixture name to the logger folder
+                if log:
+                    logger.push_folder(fixture_function.__name__)
+                try:
+                    # Run the original fixture up to its yield and pass the value to the test function
+                    generator = fixture_function(*args, **kwargs)
+                    value = next(generator)
+                    try:
+                        yield value
+                    finally:
+                        # Resume the original fixture, so its teardown code is executed
+                        next(generator, None)
+                finally:
+                    # Custom logging logic to pop the fixture name from the logger folder
+                    if log:
+                        logger.pop_folder()
+
+        else:
+
+            def wrapper(*args, **kwargs):
+                # Custom logging logic to push the fixture name to the logger folder
+                if log:
+                    logger.push_folder(fixture_function.__name__)
+                try:
+                    # Call the original fixture function and yield its result to the test function
+                    yield fixture_function(*args, **kwargs)
+                finally:
+                    # Custom logging logic to pop the fixture name from the logger folder
+                    if log:
+                        logger.pop_folder()
+
+        # Expose the original signature, so pytest injects the same fixtures; ``__wrapped__`` is deliberately not set,
+        # otherwise pytest would unwrap to the original function and lose the logging wrapper.
+        wrapper.__signature__ = inspect.signature(fixture_function)
+        wrapper.__name__ = fixture_function.__name__
+        wrapper.__qualname__ = fixture_function.__qualname__
+        wrapper.__doc__ = fixture_function.__doc__
+        wrapper.__module__ = fixture_function.__module__
+
+        return pytest.fixture(
+            scope=scope, params=params, autouse=autouse, ids=ids, name=name
+        )(wrapper)
 
     return inner_decorator
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property
 import sys
 from hyperiontf.configuration import config
 from hyperiontf.exception import HyperionException
@@ -6,19 +7,30 @@ from hyperiontf.logging import getLogger
 from hyperiontf.helpers.string_helpers import method_name_to_human_readable
 from hyperiontf.ui.automation_adapter_manager import AutomationAdaptersManager
 
-# List of reserved pytest markers
-RESERVED_MARKERS = [
-    "skip",  # Marker to skip the test
-    "skipif",  # Marker to conditionally skip the test
-    "xfail",  # Marker for tests expected to fail
-    "parametrize",  # Marker to parametrize test cases
-    "usefixtures",  # Marker for tests that use fixtures
-    "filterwarnings",  # Marker to filter specific warnings
-    "tryfirst",  # Marker for pytest hooks to run first
-    "trylast",  # Marker for pytest hooks to run last
-]
+# Set of reserved pytest markers
+RESERVED_MARKERS = frozenset(
+    {
+        "skip",  # Marker to skip the test
+        "skipif",  # Marker to conditionally skip the test
+        "xfail",  # Marker for tests expected to fail
+        "parametrize",  # Marker to parametrize test cases
+        "usefixtures",  # Marker for tests that use fixtures
+        "filterwarnings",  # Marker to filter specific warnings
+        "tryfirst",  # Marker for pytest hooks to run first
+        "trylast",  # Marker for pytest hooks to run last
+    }
+)
+
+# Markers whose arguments are the test tags
+TAG_MARKERS = frozenset({"tag", "tags"})
 
 logger = getLogger()
+adapters_manager = AutomationAdaptersManager()
+# the section object is bound once, its flags are still read on every teardown, so runtime changes are honored
+page_object_config = config.page_object
+
+# bound once, the reporter reads the clock at the start and at the end of every test
+_now = datetime.now
 
 
 class TestReporter:
@@ -43,7 +55,8 @@ class TestReporter:
             request (FixtureRequest): The pytest request object containing test metadata.
         """
         self.request = request
-        self.start_time = datetime.now()
+        self.start_time = _now()
+        self._status = None
         self._init_test_log()
 
     def _init_test_log(self):
@@ -65,17 +78,18 @@ class TestReporter:
         """
         Log the initial metadata, including the test name, description, and tags.
         """
-        logger.add_meta("testName", self.test_name)
-        logger.add_meta("testDescription", self.test_description)
-        if len(self.test_tags) > 0:
-            logger.add_meta("testTags", self.test_tags)
+        meta = {"testName": self.test_name, "testDescription": self.test_description}
+        if self.test_tags:
+            meta["testTags"] = self.test_tags
+        logger.add_metas(**meta)
 
     def _log_final_meta(self):
         """
         Log final metadata at the end of the test, including the duration and status.
         """
-        logger.add_meta("testDuration", str(datetime.now() - self.start_time))
-        logger.add_meta("testStatus", self.test_status)
+        logger.add_metas(
+            testDuration=str(_now() - self.start_time), testStatus=self._status
+        )
 
     @staticmethod
     def _close_log_folders():
@@ -89,7 +103,7 @@ class TestReporter:
         """
         Log critical information in case the test fails with an exception.
         """
-        if self.test_status == "Failed":
+        if self._status == "Failed":
             logger.critical(
                 "Test Failed with Exception", exc_info=self._fetch_last_exception()
             )
@@ -131,8 +145,8 @@ class TestReporter:
         Create a dump of the test's state in case of failure or if post-mortem dumps
         are enabled in the configuration. Dumps are created using the automation adapters.
         """
-        if self.test_status == "Failed" or config.page_object.post_morten_dumps:
-            AutomationAdaptersManager().make_state_dump()
+        if self._status == "Failed" or page_object_config.post_morten_dumps:
+            adapters_manager.make_state_dump()
 
     @staticmethod
     def _finalize_automation():
@@ -140,10 +154,10 @@ class TestReporter:
         Finalize automation by quitting all automation adapters if auto quit is enabled
         in the configuration.
         """
-        if config.page_object.auto_quit:
-            AutomationAdaptersManager().quit_all()
+        if page_object_config.auto_quit:
+            adapters_manager.quit_all()
 
-    @property
+    @cached_property
     def test_node(self):
         """
         Return the pytest node for the current test.
@@ -153,7 +167,7 @@ class TestReporter:
         """
         return self.request.node
 
-    @property
+    @cached_property
     def raw_test_name(self):
         """
         Get the test name as it appears in pytest.request.node object.
@@ -163,7 +177,7 @@ class TestReporter:
         """
         return self.test_node.name
 
-    @property
+    @cached_property
     def test_name(self):
         """
         Get the test name in a human-readable format.
@@ -173,21 +187,37 @@ class TestReporter:
         """
         return method_name_to_human_readable(self.raw_test_name)
 
-    @property
+    @cached_property
     def test_tags(self):
         """
         Collect and return a list of all non-reserved markers applied to the test.
 
+        Arguments of ``tag``/``tags`` markers are used as tags themselves, the marker names are not.
+
         Returns:
-            list: A list of tags applied to the test.
+            list: A list of tags applied to the test, or a shared empty tuple when there are none.
         """
-        tags = []
-        for marker in self.test_node.own_markers:
-            if marker.name not in RESERVED_MARKERS:
-                tags.append(marker.name)
-            if marker.name == "tag" or marker.name == "tags":
-                tags += marker.args
-        return list(set(tags))
+        markers = self.test_node.own_markers
+        if not markers:
+            return ()
+
+        tags = set()
+        for marker in markers:
+            tags.update(self._marker_tags(marker))
+        return list(tags) if tags else ()
+
+    @staticmethod
+    def _marker_tags(marker):
+        """
+        Tags contributed by a single marker: the arguments of ``tag``/``tags`` markers, nothing for reserved markers
+        and the marker name for any other one.
+        """
+        name = marker.name
+        if name in TAG_MARKERS:
+            return marker.args
+        if name in RESERVED_MARKERS:
+            return ()
+        return (name,)
 
     @property
     def test_status(self):
@@ -197,7 +227,12 @@ class TestReporter:
         Returns:
             str: The test status, which can be "Passed", "Failed", or "Skipped".
         """
-        last_entry = list(self.test_node.stash._storage.values())[-1]
+        try:
+            # dicts keep insertion order, so the last entry is read without materializing the whole stash
+            last_entry = next(reversed(self.test_node.stash._storage.values()))
+        except StopIteration:
+            return "Skipped"
+
         if last_entry.get("call"):
             if last_entry["call"]:
                 return "Passed"
@@ -208,7 +243,7 @@ class TestReporter:
         else:
             return "Skipped"
 
-    @property
+    @cached_property
     def test_description(self):
         """
         Retrieve and return the test's docstring as its description.
@@ -216,15 +251,19 @@ class TestReporter:
         Returns:
             str: The description of the test, extracted from the test function's docstring.
         """
-        name = self.raw_test_name.split("[")[0]
-        description = getattr(self.test_node.module, name).__doc__ or ""
-        return description.strip()
+        name = self.raw_test_name.partition("[")[0]
+        test_function = getattr(self.test_node.module, name, None)
+        description = test_function.__doc__ if test_function is not None else None
+        return description.strip() if description else ""
 
     def finalize(self):
         """
         Finalize the test reporting. This includes logging the final metadata,
         closing log folders, dumping test state if necessary, and finalizing automation adapters.
+
+        The test status is resolved once here and reused by all finalization steps.
         """
+        self._status = self.test_status
         self._log_final_meta()
         self._close_log_folders()
         self._log_exception()
@@ -1,3 +1,4 @@
+import os
 import shutil
 from pathlib import Path
 from .file import File
@@ -68,6 +69,8 @@ class Dir:
             force (bool): If True, forcefully delete the directory and all its contents.
         """
         if force:
+            # rmtree walks the tree with scandir and, on Linux, deletes through directory file descriptors, which
+            # keeps it safe against directories being swapped for symlinks mid-delete
             shutil.rmtree(self.path)
         else:
             self.path.rmdir()
@@ -80,10 +83,46 @@ class Dir:
             tuple: A tuple containing two lists - the first with Dir objects for each subdirectory,
                    and the second with File objects for each file in the directory.
         """
-        dirs = [Dir(child) for child in self.path.iterdir() if child.is_dir()]
-        files = [File(child) for child in self.path.iterdir() if child.is_file()]
+        dirs = []
+        files = []
+        # a single directory read; DirEntry answers is_dir/is_file from the entry type without an extra stat,
+        # except for symlinks, which are followed as before
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    dirs.append(Dir(entry.path))
+                elif entry.is_file():
+                    files.append(File(entry.path))
         return (dirs, files)
 
+    def iter_dirs(self):
+        """
+        Lazily iterate over the subdirectories, yielding Dir objects as the directory is read.
+
+        Unlike list_content, nothing is materialized upfront, so callers looking for a specific entry can stop early.
+
+        Yields:
+            Dir: A Dir object for each subdirectory.
+        """
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield Dir(entry.path)
+
+    def iter_files(self):
+        """
+        Lazily iterate over the files, yielding File objects as the directory is read.
+
+        Unlike list_content, nothing is materialized upfront, so callers looking for a specific entry can stop early.
+
+        Yields:
+            File: A File object for each file in the directory.
+        """
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    yield File(entry.path)
+
     def size(self):
         """
         Calculate the total size of the directory by aggregating the sizes of all files within it.
@@ -92,7 +131,13 @@ class Dir:
             int: The total size of the directory in bytes.
         """
         total_size = 0
-        for child in self.path.rglob("*"):
-            if child.is_file():
-                total_size += child.stat().st_size
+        pending = [os.fspath(self.path)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    # symlinked directories are not descended into, symlinked files count with their target size
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
         return total_size
@@ -1,5 +1,16 @@
 import hashlib
 import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+# read-ahead hint for whole-file hashing, only available on POSIX platforms
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+
+# number of files whose checksums are kept, the least recently used file is evicted first
+_CHECKSUM_CACHE_SIZE = 128
+# digests of files modified more recently than this are not cached, see File._store_checksum
+_RECENT_CHANGE_WINDOW_NS = 2_000_000_000
 
 
 class File:
@@ -34,6 +45,10 @@ class File:
     to the robustness and maintainability of test suites.
     """
 
+    # absolute path -> {hash method: ((st_mtime_ns, st_size, st_ino), hex digest)}, shared by all instances and
+    # bounded to _CHECKSUM_CACHE_SIZE files in least recently used order
+    _checksum_cache: OrderedDict = OrderedDict()
+
     def __init__(self, path, mode="r"):
         """
         Initializes a new instance of the File class.
@@ -71,12 +86,15 @@ class File:
         """
         if self._file is None:
             self._file = open(self._path, self.mode)
+            # binary reads are usually whole-file reads (images, downloads), let the kernel read ahead
+            if _FADV_SEQUENTIAL is not None and "r" in self.mode and "b" in self.mode:
+                os.posix_fadvise(self._file.fileno(), 0, 0, _FADV_SEQUENTIAL)
 
     def close(self):
         """
         Closes the file associated with this File instance.
 
-        If the file is currently open, this method closes it and releases any system resources associated with it. If the file is already closed or was never opened, this method has no effect. It's good practice to call this method when you're done with a file to ensure resources are freed promptly. Alternatively, using the File instance as a context manager (with the 'with' statement) can automate this process.
+        If the file is currently open, this method closes it and releases any system resources associated with it. If the file is already closed or was never opened, this method has no effect. It's good practice to call this method when you're done with a file to ensure resources are freed promptly. Alternatively, using the File instance as a context manager (with the 'with' statement) can automate this process. File instances have no finalizer of their own; a file left open is closed by the underlying file object once it is garbage collected.
 
         Example usage:
             file = File('/path/to/file.txt', 'r')
@@ -142,6 +160,28 @@ class File:
             raise IOError("File not opened for writing")
         self.open()
         self._file.write(content)
+        self._invalidate_checksum()
+
+    def writelines(self, chunks):
+        """
+        Writes a sequence of strings or bytes to the file in a single call.
+
+        This method behaves like calling 'write' for every chunk, but hands the whole iterable to the underlying
+        file object at once, which is considerably cheaper when many small pieces of content are written in a loop.
+        No line separators are added.
+
+        Args:
+            chunks (iterable of str or bytes): The content pieces to write. Strings are expected in text mode and
+                bytes in binary mode.
+
+        Raises:
+            IOError: If the file is not opened in a mode that supports writing ('w', 'w+', 'a', 'a+').
+        """
+        if "w" not in self.mode and "+" not in self.mode and "a" not in self.mode:
+            raise IOError("File not opened for writing")
+        self.open()
+        self._file.writelines(chunks)
+        self._invalidate_checksum()
 
     def append(self, content):
         """
@@ -159,6 +199,7 @@ class File:
             raise IOError("File not opened for appending")
         self.open()
         self._file.write(content)
+        self._invalidate_checksum()
 
     def exists(self):
         """
@@ -169,7 +210,11 @@ class File:
         Returns:
             bool: True if the file exists, False otherwise.
         """
-        return os.path.exists(self.path)
+        try:
+            self._stat()
+        except (OSError, ValueError):
+            return False
+        return True
 
     def checksum(self, method="sha256"):
         """
@@ -180,19 +225,80 @@ class File:
         Args:
             method (str): The name of the hash algorithm to use for computing the checksum. Defaults to 'sha256'. Other common values include 'md5', 'sha1', etc., depending on the required level of collision resistance and performance.
 
+        Digests are cached per file and hash method, and reused as long as the file modification time, size and inode
+        stay the same, so repeated comparisons of unchanged files do not re-read them. Writes through File instances
+        drop the cached digests right away. Files modified within the last two seconds are always re-hashed, so a
+        same-size rewrite by another process within the filesystem timestamp granularity is not served a stale
+        digest.
+
         Returns:
             str: The hexadecimal digest of the checksum.
 
         Raises:
             ValueError: If the specified hash algorithm is not supported.
         """
-        hasher = hashlib.new(method)
-        with open(self.path, "rb") as f:
-            buf = f.read(65536)
-            while len(buf) > 0:
-                hasher.update(buf)
-                buf = f.read(65536)
-        return hasher.hexdigest()
+        return self._checksum(self._stat(), method)
+
+    def _checksum(self, stat: os.stat_result, method: str) -> str:
+        """
+        Computes the checksum for an already taken stat result, reusing the cached digest when the file is unchanged.
+        """
+        abs_path = os.path.abspath(self._path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._cached_checksum(abs_path, method, signature)
+        if cached is not None:
+            return cached
+
+        # file_digest runs the read/update loop in C and hashes straight from the file object
+        with open(abs_path, "rb") as f:
+            if _FADV_SEQUENTIAL is not None:
+                os.posix_fadvise(f.fileno(), 0, 0, _FADV_SEQUENTIAL)
+            digest = hashlib.file_digest(f, method).hexdigest()
+        self._store_checksum(abs_path, method, signature, digest)
+        return digest
+
+    @staticmethod
+    def _cached_checksum(abs_path: str, method: str, signature: tuple) -> Optional[str]:
+        """
+        Return the cached digest of the file, or None when there is none or the file has changed since.
+        """
+        digests = File._checksum_cache.get(abs_path)
+        if digests is None:
+            return None
+        File._checksum_cache.move_to_end(abs_path)
+        cached = digests.get(method)
+        if cached is None or cached[0] != signature:
+            return None
+        return cached[1]
+
+    @staticmethod
+    def _store_checksum(abs_path: str, method: str, signature: tuple, digest: str):
+        """
+        Cache the digest of the file, evicting the least recently used file when the cache is full.
+
+        A file modified within the last moments may be rewritten with the same size without its modification time
+        changing, as timestamps have a limited granularity, so such digests are not cached at all.
+        """
+        if time.time_ns() - signature[0] < _RECENT_CHANGE_WINDOW_NS:
+            return
+        cache = File._checksum_cache
+        cache.setdefault(abs_path, {})[method] = (signature, digest)
+        cache.move_to_end(abs_path)
+        if len(cache) > _CHECKSUM_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _stat(self) -> os.stat_result:
+        """
+        Single stat call shared by exists, size and checksum. The result is intentionally not kept between calls,
+        files under test are often produced by other processes (downloads, screenshots) while being polled.
+        """
+        return os.stat(self._path)
+
+    def _invalidate_checksum(self):
+        """
+        Forget cached checksums of the file, called whenever the file content is changed through this instance.
+        """
+        File._checksum_cache.pop(os.path.abspath(self._path), None)
 
     def remove(self):
         """
@@ -206,6 +312,7 @@ class File:
         """
         os.remove(self._path)
         self._file = None
+        self._invalidate_checksum()
 
     @property
     def file(self):
@@ -238,7 +345,7 @@ class File:
         Raises:
             FileNotFoundError: If the file does not exist.
         """
-        return os.path.getsize(self._path)
+        return self._stat().st_size
 
     @property
     def filename(self):
@@ -302,7 +409,14 @@ class File:
     def __eq__(self, other):
         if not isinstance(other, File):
             return False
-        return self.checksum() == other.checksum()
+        own_stat = self._stat()
+        other_stat = other._stat()
+        # files of different size can never have matching content, no need to hash them
+        if own_stat.st_size != other_stat.st_size:
+            return False
+        return self._checksum(own_stat, "sha256") == other._checksum(
+            other_stat, "sha256"
+        )
 
     def __enter__(self):
         self.open()
@@ -310,6 +424,3 @@ class File:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
-
-    def __del__(self):
-        self.close()
@@ -1,3 +1,7 @@
+from functools import wraps
+from threading import RLock
+
+
 def Singleton(cls):
     """
     Decorator to make a class Singleton by adding a custom __new__ method which ensures that only one instance can be
@@ -5,14 +9,24 @@ def Singleton(cls):
 
     NOTE: The class to be decorated should not implement a __new__ method.
 
+    The instance is kept in a single slot, so each access is one ``is None`` check rather than a dict lookup. The
+    first construction is guarded by a lock, so concurrent first calls from several threads still create only one
+    instance. The decorated class itself stays reachable through ``__wrapped__``.
+
     :param cls: The class to decorate.
     :return: The decorated class.
     """
-    instances = {}
+    instance = None
+    lock = RLock()
 
+    @wraps(cls, updated=())
     def wrapper(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            with lock:
+                # re-check under the lock, another thread may have finished construction meanwhile
+                if instance is None:
+                    instance = cls(*args, **kwargs)
+        return instance
 
     return wrapper
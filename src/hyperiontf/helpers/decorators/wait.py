@@ -47,8 +47,10 @@ def wait(
             Returns:
                 The result of the decorated function if successful within the timeout period; otherwise, None or raises an exception.
             """
-            deadline = time.time() + timeout
-            while time.time() < deadline:
+            # monotonic clock, so system clock adjustments cannot shorten or stretch the wait
+            deadline = time.monotonic() + timeout
+            now = time.monotonic()
+            while now < deadline:
                 try:
                     result = func(self, *args, **kwargs)
                     if result:
@@ -56,9 +58,9 @@ def wait(
                 except Exception:
                     # Handle any exceptions that might occur in the function call.
                     pass
-                time.sleep(
-                    sleep_interval
-                )  # Sleep for the specified interval between retries.
+                # Sleep for the specified interval between retries, without overshooting the deadline.
+                time.sleep(max(min(sleep_interval, deadline - time.monotonic()), 0))
+                now = time.monotonic()
 
             if raise_exception:
                 raise exception_class(
@@ -31,11 +31,9 @@ def without_failure(
     handled gracefully.
 
     :param logger: An optional Logger object to log the exceptions. If not provided, a default logger named
-                   'withoutFailuresLogger' will be used.
+                   'withoutFailuresLogger' will be used, resolved only once the first exception is caught.
     :return: The decorated function.
     """
-    if logger is None:
-        logger = getLogger("withoutFailuresLogger")
 
     def inner_decorator(method: Callable) -> Callable | property:
         """
@@ -53,9 +51,12 @@ def without_failure(
             :param kwargs: Keyword arguments to be passed to the wrapped function.
             :return: The result of the wrapped function if successful, None if an exception occurs.
             """
+            nonlocal logger
             try:
                 return method(*args, **kwargs)
             except Exception as e:
+                if logger is None:
+                    logger = getLogger("withoutFailuresLogger")
                 logger.debug(f"{e.__class__.__name__}: {e}")
                 return None
 
@@ -3,22 +3,22 @@ def extra_fields_analysis(actual_fields, expected_fields) -> str:
     Analyze and report extra fields present in either of the two sets of dictionary keys.
 
     Args:
-    actual_fields (set): A set of keys from the actual dictionary.
-    expected_fields (set): A set of keys from the expected dictionary.
+    actual_fields (set or dict keys view): Keys of the actual dictionary.
+    expected_fields (set or dict keys view): Keys of the expected dictionary.
 
     Returns:
     str: A message string listing extra fields found in either the actual or expected dictionaries.
     """
     extra_in_actual = actual_fields - expected_fields
     extra_in_expected = expected_fields - actual_fields
-    message = ""
+    parts = []
 
     if extra_in_actual:
-        message += f"\nActual dictionary has extra fields: {extra_in_actual}"
+        parts.append(f"\nActual dictionary has extra fields: {extra_in_actual}")
     if extra_in_expected:
-        message += f"\nExpected dictionary has extra fields: {extra_in_expected}"
+        parts.append(f"\nExpected dictionary has extra fields: {extra_in_expected}")
 
-    return message
+    return "".join(parts)
 
 
 def value_differences_analysis(actual, expected, common_fields) -> str:
@@ -33,11 +33,15 @@ def value_differences_analysis(actual, expected, common_fields) -> str:
     Returns:
     str: A message string detailing discrepancies in values for common fields.
     """
-    message = ""
+    parts = []
     for field in common_fields:
-        if actual[field] != expected[field]:
-            message += f"\n'{field}' field: actual value {actual[field]} is not equal to expected value {expected[field]}"
-    return message
+        actual_value = actual[field]
+        expected_value = expected[field]
+        if actual_value != expected_value:
+            parts.append(
+                f"\n'{field}' field: actual value {actual_value} is not equal to expected value {expected_value}"
+            )
+    return "".join(parts)
 
 
 def dict_diff(actual, expected) -> str:
@@ -54,14 +58,15 @@ def dict_diff(actual, expected) -> str:
     Returns:
     str: A compiled message string describing all differences found between the dictionaries.
     """
-    actual_fields = set(actual.keys())
-    expected_fields = set(expected.keys())
+    # key views support set operations directly, no need to copy them into sets
+    actual_fields = actual.keys()
+    expected_fields = expected.keys()
 
     # Analyze extra fields
     extra_fields_message = extra_fields_analysis(actual_fields, expected_fields)
 
     # Analyze value differences in common fields
-    common_fields = actual_fields.intersection(expected_fields)
+    common_fields = actual_fields & expected_fields
     value_diff_message = value_differences_analysis(actual, expected, common_fields)
 
     # Combine messages
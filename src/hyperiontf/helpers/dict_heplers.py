@@ -1,6 +1,8 @@
-import copy
 from .string_helpers import snake_to_camel_case
 
+# scalar types returned as is without going through the dict/list checks, the bulk of values in capabilities
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 def transform_keys_to_camel_case(data):
     """
@@ -10,19 +12,33 @@ def transform_keys_to_camel_case(data):
         data (dict): The dictionary whose keys are to be transformed.
 
     Returns:
-        dict: A deep copy of the original dictionary, but with keys in camelCase.
+        dict: A new dictionary with keys in camelCase. Nested dictionaries and lists are rebuilt as well, other
+        values are shared with the original dictionary.
 
     Examples:
         transform_keys_to_camel_case({"snake_case_key": "value"}) -> {"snakeCaseKey": "value"}
         transform_keys_to_camel_case({"nested_key": {"snake_case_key": "value"}}) -> {"nestedKey": {"snakeCaseKey": "value"}}
     """
-    new_data = copy.deepcopy(data)
-    if isinstance(new_data, dict):
-        return {
-            snake_to_camel_case(k): transform_keys_to_camel_case(v)
-            for k, v in new_data.items()
-        }
-    elif isinstance(new_data, list):
-        return [transform_keys_to_camel_case(v) for v in new_data]
-    else:
-        return new_data
+    if type(data) in _LEAF_TYPES:
+        return data
+    if isinstance(data, dict):
+        return _transform_dict_keys(data)
+    if isinstance(data, list):
+        return _transform_list_items(data)
+    return data
+
+
+def _transform_dict_keys(data: dict) -> dict:
+    """
+    Rebuild a dictionary with camelCase keys, transforming its values as well.
+    """
+    return {
+        snake_to_camel_case(k): transform_keys_to_camel_case(v) for k, v in data.items()
+    }
+
+
+def _transform_list_items(data: list) -> list:
+    """
+    Rebuild a list, transforming the keys of the dictionaries it contains.
+    """
+    return [transform_keys_to_camel_case(v) for v in data]
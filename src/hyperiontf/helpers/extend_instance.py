@@ -1,5 +1,8 @@
 import types
-import re
+
+
+def _is_protected_method(method_name: str) -> bool:
+    return method_name.startswith("__") and method_name.endswith("__")
 
 
 def extend_instance_with_module(instance: object, module: types.ModuleType):
@@ -13,7 +16,7 @@ def extend_instance_with_module(instance: object, module: types.ModuleType):
     :param instance: The instance to be extended with the methods from the module.
     :param module: The module containing the methods to be added to the instance.
     """
-    for method in dir(module):
-        if re.match("^__.*?__$", method):
+    for name, value in vars(module).items():
+        if _is_protected_method(name) or not callable(value):
             continue
-        setattr(instance, method, types.MethodType(getattr(module, method), instance))
+        setattr(instance, name, types.MethodType(value, instance))
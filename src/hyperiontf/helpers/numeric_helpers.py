@@ -1,3 +1,6 @@
+from math import gcd
+
+
 def greatest_common_divisor(a, b):
     """
     Calculate the Greatest Common Divisor (GCD) of two numbers.
@@ -9,6 +12,4 @@ def greatest_common_divisor(a, b):
     Returns:
         int: The GCD of a and b.
     """
-    while b:
-        a, b = b, a % b
-    return a
+    return gcd(a, b)
@@ -1,23 +1,27 @@
 """
-Module Constants:
+Module Functions:
 ------------------
-PROTECTED_METHODS_PATTERN:
-    A regular expression pattern used to match method names that start and end with '__' (dunder methods).
+_is_protected_method:
+    Checks whether a method name starts and ends with '__' (dunder methods).
     Methods with such names will be ignored by the auto-logging decorator.
 """
 
 from typing import List, Type
-import re
 
-PROTECTED_METHODS_PATTERN = "^__.*?__$"
+
+def _is_protected_method(method_name: str) -> bool:
+    return method_name.startswith("__") and method_name.endswith("__")
 
 
 def extend_with_parent_methods(base_class, parent_class, instance_methods):
+    # set mirror of instance_methods, keeps the membership check O(1) while the list keeps its order
+    known_methods = set(instance_methods)
     while parent_class is not base_class:
         for method_name in dir(parent_class):
-            if method_name not in instance_methods and not bool(
-                re.match(PROTECTED_METHODS_PATTERN, method_name)
+            if method_name not in known_methods and not _is_protected_method(
+                method_name
             ):
+                known_methods.add(method_name)
                 instance_methods.append(method_name)
         parent_class = parent_class.__bases__[0]
 
@@ -36,7 +40,7 @@ def get_instance_unique_methods(
     :param base_class: The base class to compare against when finding unique methods.
     :return: A list of method names that are unique to the instance compared to the base class.
     """
-    base_class_methods = dir(base_class)
+    base_class_methods = set(dir(base_class))
     instance_methods = dir(instance)
     parent_class = instance.__class__.__bases__[0]
 
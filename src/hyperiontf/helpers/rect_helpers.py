@@ -1,3 +1,8 @@
+from operator import itemgetter
+
+_rect_values = itemgetter("x", "y", "height", "width")
+
+
 def are_rectangles_equal(rect1, rect2) -> bool:
     """
     Compare two rectangles to determine if they are equal.
@@ -15,9 +20,4 @@ def are_rectangles_equal(rect1, rect2) -> bool:
     Returns:
     - bool: True if the rectangles are equal in position (x, y) and size (width, height), False otherwise.
     """
-    return (
-        rect1["x"] == rect2["x"]
-        and rect1["y"] == rect2["y"]
-        and rect1["height"] == rect2["height"]
-        and rect1["width"] == rect2["width"]
-    )
+    return _rect_values(rect1) == _rect_values(rect2)
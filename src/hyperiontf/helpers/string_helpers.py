@@ -1,6 +1,12 @@
 import re
+from functools import lru_cache
 from typing import List
 
+# position in front of every uppercase letter except the first character
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+# a single CamelCase word: a capitalized or lowercase word, or a run of capitals (acronym)
+_camel_words = re.compile(r"[A-Za-z](?:[a-z]+|[A-Z]*(?=[A-Z]|$))").findall
+
 
 def camel_case_split(text: str) -> List[str]:
     """
@@ -13,7 +19,7 @@ def camel_case_split(text: str) -> List[str]:
     :param text: The CamelCase formatted text to split.
     :return: A list of individual words from the input text.
     """
-    return re.findall(r"[A-Za-z](?:[a-z]+|[A-Z]*(?=[A-Z]|$))", text)
+    return _camel_words(text)
 
 
 def snake_notation_split(text: str) -> List[str]:
@@ -30,23 +36,23 @@ def snake_notation_split(text: str) -> List[str]:
     return text.split("_")
 
 
+@lru_cache(maxsize=4096)
 def method_name_to_human_readable(text: str) -> str:
     """
     Converts a method name to human-readable form.
 
     This function takes a method name, which can be written in either CamelCase or snake_case format, and converts it to
-    a human-readable form. It first splits the method name into individual words using the `camel_case_split` and
-    `snake_notation_split` functions. Then, it combines the words and capitalizes the first letter to create a
-    human-readable representation.
+    a human-readable form. It first splits the method name into individual words with the same pattern as
+    `camel_case_split`, which also breaks words on underscores. Then, it combines the words and capitalizes the first
+    letter to create a human-readable representation.
+
+    Results are memoized, as the same test and page object method names are converted over and over.
 
     :param text: The method name to convert.
     :return: The human-readable representation of the method name.
     """
-    return (
-        " ".join(camel_case_split(" ".join(snake_notation_split(text))))
-        .lower()
-        .capitalize()
-    )
+    # underscores are not letters, so the CamelCase word pattern already treats them as separators
+    return " ".join(_camel_words(text)).lower().capitalize()
 
 
 def camel_to_snake_case(camel_str):
@@ -63,14 +69,12 @@ def camel_to_snake_case(camel_str):
         camel_to_snake_case("camelCaseString") -> "camel_case_string"
         camel_to_snake_case("anotherExampleString") -> "another_example_string"
     """
-    result = [camel_str[0].lower()]
-    for char in camel_str[1:]:
-        if char.isupper():
-            result.append("_")
-        result.append(char.lower())
-    return "".join(result)
+    if len(camel_str) < 2:
+        return camel_str.lower()
+    return _CAMEL_BOUNDARY_RE.sub("_", camel_str).lower()
 
 
+@lru_cache(maxsize=4096)
 def snake_to_camel_case(snake_str):
     """
     Convert a snake_case string to camelCase.
@@ -85,5 +89,7 @@ def snake_to_camel_case(snake_str):
         to_camel_case("snake_case_string") -> "snakeCaseString"
         to_camel_case("another_example_string") -> "anotherExampleString"
     """
-    components = snake_str.split("_")
-    return components[0] + "".join(x.title() for x in components[1:])
+    head, separator, tail = snake_str.partition("_")
+    if not separator:
+        return snake_str
+    return head + "".join(x[:1].upper() + x[1:] for x in tail.split("_"))
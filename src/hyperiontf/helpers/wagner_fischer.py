@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 
 def initialize_matrix(rows, cols):
     """
@@ -10,9 +12,9 @@ def initialize_matrix(rows, cols):
     cols (int): Number of columns in the matrix, corresponding to the length of the second string plus one.
 
     Returns:
-    list: A 2D list (matrix) initialized with zeros.
+    numpy.ndarray: A 2D int32 matrix initialized with zeros, allocated as a single contiguous buffer.
     """
-    return [[0 for _ in range(cols)] for _ in range(rows)]
+    return np.zeros((rows, cols), dtype=np.int32)
 
 
 def initialize_base_distance_cost(matrix, actual, expected):
@@ -25,9 +27,9 @@ def initialize_base_distance_cost(matrix, actual, expected):
     of length n to an empty string (or vice versa) through deletions (or insertions).
 
     Args:
-    matrix (list of list of int): The matrix used in the Wagner-Fischer algorithm. It should be
-                                  initialized with zeroes and have dimensions
-                                  (len(actual) + 1) x (len(expected) + 1).
+    matrix (numpy.ndarray): The matrix used in the Wagner-Fischer algorithm. It should be
+                            initialized with zeroes and have dimensions
+                            (len(actual) + 1) x (len(expected) + 1).
     actual (str or list): The actual string or list of elements. Used to determine the operations made on each element.
     expected (str or list): The expected string or list of elements. Compared against the actual sequence.
 
@@ -37,7 +39,7 @@ def initialize_base_distance_cost(matrix, actual, expected):
     Example:
     >>> matrix = initialize_matrix(4, 5) # For strings of length 3 and 4
     >>> initialize_base_distance_cost(matrix, [1, 2, 3], [2, 3, 4, 5])
-    >>> matrix
+    >>> matrix.tolist()
     [[0, 1, 2, 3, 4], [1, 0, 0, 0, 0], [2, 0, 0, 0, 0], [3, 0, 0, 0, 0]]
 
     Note:
@@ -45,10 +47,54 @@ def initialize_base_distance_cost(matrix, actual, expected):
     - This method is typically called at the beginning of the Wagner-Fischer algorithm to set up the
       initial conditions for the dynamic programming approach.
     """
-    for i in range(len(actual) + 1):
-        matrix[i][0] = i
-    for j in range(len(expected) + 1):
-        matrix[0][j] = j
+    matrix[:, 0] = np.arange(len(actual) + 1)
+    matrix[0, :] = np.arange(len(expected) + 1)
+
+
+def sequence_codes(actual, expected):
+    """
+    Map the items of both sequences to integer codes, so that item equality becomes integer equality.
+
+    Strings are converted to arrays of their code points. For lists every distinct item gets its own code, which
+    requires the items to be hashable.
+
+    Args:
+    actual (str or list): The actual string or list of elements.
+    expected (str or list): The expected string or list of elements.
+
+    Returns:
+    tuple or None: The pair of integer arrays for 'actual' and 'expected', or None when the items cannot be
+                   hashed and have to be compared one by one.
+    """
+    if isinstance(actual, str) and isinstance(expected, str):
+        return _string_codes(actual), _string_codes(expected)
+    return _hashable_codes(actual, expected)
+
+
+def _string_codes(text: str):
+    """
+    Convert a string to the array of its code points.
+    """
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+
+
+def _hashable_codes(actual, expected):
+    """
+    Give every distinct item of both sequences its own integer code.
+
+    Returns:
+    tuple or None: The pair of integer arrays for 'actual' and 'expected', or None when an item is not hashable.
+    """
+    codes: dict = {}
+    try:
+        actual_codes = [codes.setdefault(item, len(codes)) for item in actual]
+        expected_codes = [codes.setdefault(item, len(codes)) for item in expected]
+    except TypeError:
+        return None
+    return (
+        np.array(actual_codes, dtype=np.int64),
+        np.array(expected_codes, dtype=np.int64),
+    )
 
 
 def calculate_distances(matrix, actual, expected):
@@ -59,17 +105,33 @@ def calculate_distances(matrix, actual, expected):
     which are used to determine the minimum number of edits (insertions, deletions, substitutions)
     needed to transform the actual string into the expected string.
 
+    Each row is computed with numpy operations instead of a per-cell Python loop. Deletions and substitutions only
+    depend on the previous row. The remaining insertion term, current[j] = min(best[j], current[j - 1] + 1), unrolls
+    to current[j] = j + min(best[k] - k for k <= j), which is a running minimum.
+
     Args:
-    matrix (list): The initialized matrix.
+    matrix (numpy.ndarray): The initialized matrix.
     actual (str or list): The actual string or list of elements. Used to determine the operations made on each element.
     expected (str or list): The expected string or list of elements. Compared against the actual sequence.
     """
+    columns = np.arange(len(expected) + 1, dtype=np.int32)
+    codes = sequence_codes(actual, expected)
+    best = np.empty(len(expected) + 1, dtype=np.int32)
+    previous = matrix[0]
     for i in range(1, len(actual) + 1):
-        for j in range(1, len(expected) + 1):
-            diff = 0 if actual[i - 1] == expected[j - 1] else 1
-            matrix[i][j] = min(
-                matrix[i - 1][j] + 1, matrix[i][j - 1] + 1, matrix[i - 1][j - 1] + diff
+        if codes is not None:
+            diff = codes[1] != codes[0][i - 1]
+        else:
+            actual_item = actual[i - 1]
+            diff = np.fromiter(
+                (not actual_item == item for item in expected),
+                dtype=bool,
+                count=len(expected),
             )
+        best[0] = i
+        np.minimum(previous[1:] + 1, previous[:-1] + diff, out=best[1:])
+        matrix[i] = np.minimum.accumulate(best - columns) + columns
+        previous = matrix[i]
 
 
 def handle_deletion(i, j):
@@ -124,14 +186,14 @@ def is_deletion(matrix, i, j):
     Check if the current matrix position indicates a deletion operation.
 
     Args:
-    matrix (list): The matrix containing edit distances.
+    matrix (numpy.ndarray): The matrix containing edit distances.
     i (int): The current row index in the matrix.
     j (int): The current column index in the matrix.
 
     Returns:
     bool: True if the current operation is a deletion, False otherwise.
     """
-    return i > 0 and matrix[i][j] == matrix[i - 1][j] + 1
+    return i > 0 and matrix[i, j] == matrix[i - 1, j] + 1
 
 
 def is_addition(matrix, i, j):
@@ -139,14 +201,14 @@ def is_addition(matrix, i, j):
     Check if the current matrix position indicates an addition operation.
 
     Args:
-    matrix (list): The matrix containing edit distances.
+    matrix (numpy.ndarray): The matrix containing edit distances.
     i (int): The current row index in the matrix.
     j (int): The current column index in the matrix.
 
     Returns:
     bool: True if the current operation is an addition, False otherwise.
     """
-    return j > 0 and matrix[i][j] == matrix[i][j - 1] + 1
+    return j > 0 and matrix[i, j] == matrix[i, j - 1] + 1
 
 
 def need_to_process(i, j):
@@ -168,21 +230,43 @@ def trace_operations(matrix, actual, expected, result, i, j):
     Trace the operations from the bottom-right to the top-left of the matrix, constructing the difference string.
 
     Args:
-    matrix (list): The matrix containing edit distances.
+    matrix (numpy.ndarray): The matrix containing edit distances.
     actual (str or list): The actual string or list of elements. Used to determine the operations made on each element.
     expected (str or list): The expected string or list of elements. Compared against the actual sequence.
     result (list): The list to store the result characters.
     i (int): The starting row index for tracing back.
     j (int): The starting column index for tracing back.
+
+    The matrix cells are read through ``matrix.item``, which returns plain Python ints and is much cheaper than
+    numpy scalar indexing for the up to len(actual) + len(expected) cells the trace visits.
     """
-    while need_to_process(i, j):
-        if is_deletion(matrix, i, j):
-            i, j, char = handle_deletion(i, j)
-        elif is_addition(matrix, i, j):
-            i, j, char = handle_addition(i, j)
-        else:
-            i, j, char = handle_substitution(i, j, actual, expected)
-        result.append(str(char))
+    cell = matrix.item
+    append = result.append
+    while i or j:
+        i, j, char = _trace_step(cell, actual, expected, i, j)
+        append(str(char))
+
+
+def _trace_step(cell, actual, expected, i, j):
+    """
+    Select the operation leading to the cell (i, j) and step back to the cell it came from.
+
+    Args:
+    cell (callable): Reads a matrix cell as a plain int, i.e. ``matrix.item``.
+    actual (str or list): The actual string or list of elements.
+    expected (str or list): The expected string or list of elements.
+    i (int): The current row index in the matrix.
+    j (int): The current column index in the matrix.
+
+    Returns:
+    tuple: Updated indices (i, j) and the item or symbol describing the operation.
+    """
+    distance = cell(i, j)
+    if i and distance == cell(i - 1, j) + 1:
+        return handle_deletion(i, j)
+    if j and distance == cell(i, j - 1) + 1:
+        return handle_addition(i, j)
+    return handle_substitution(i, j, actual, expected)
 
 
 def reconstruct_string(matrix, actual, expected, delimiter: str = ""):
@@ -195,7 +279,7 @@ def reconstruct_string(matrix, actual, expected, delimiter: str = ""):
     by the specified delimiter.
 
     Args:
-    matrix (list of list of int): The matrix containing edit distances. It is filled by the Wagner-Fischer algorithm.
+    matrix (numpy.ndarray): The matrix containing edit distances. It is filled by the Wagner-Fischer algorithm.
     actual (str or list): The actual string or list of elements. Used to determine the operations made on each element.
     expected (str or list): The expected string or list of elements. Compared against the actual sequence.
     delimiter (str): The delimiter to use between items in the reconstructed string. Defaults to an empty string (''),
@@ -220,13 +304,20 @@ def generate_distance_matrix(actual, expected):
     This function initializes the matrix and calculates the edit distances between
     substrings of the actual and expected strings.
 
+    The rows are computed one Python iteration at a time, so the matrix is always filled along the shorter sequence.
+    All edit costs are symmetric, therefore the matrix for (expected, actual) is exactly the transpose of the one
+    for (actual, expected).
+
     Args:
     actual (str or list): The actual string or list of elements. Used to determine the operations made on each element.
     expected (str or list): The expected string or list of elements. Compared against the actual sequence.
 
     Returns:
-    list: The matrix filled with edit distances.
+    numpy.ndarray: The matrix filled with edit distances.
     """
+    if len(actual) > len(expected):
+        return generate_distance_matrix(expected, actual).T
+
     matrix = initialize_matrix(len(actual) + 1, len(expected) + 1)
 
     # Initialize base distance costs
@@ -237,6 +328,117 @@ def generate_distance_matrix(actual, expected):
     return matrix
 
 
+def levenshtein_distance(actual, expected) -> int:
+    """
+    Calculate the edit distance between two strings or lists without building the full Wagner-Fischer matrix.
+
+    Only two rows of the matrix are kept, and the shorter sequence is used for the rows, so the memory needed is
+    O(min(len(actual), len(expected))) instead of O(len(actual) * len(expected)). Use it when only the number of
+    edits matters and the diff itself is not needed.
+
+    Args:
+    actual (str or list): The actual string or list of elements.
+    expected (str or list): The expected string or list of elements.
+
+    Returns:
+    int: The minimum number of insertions, deletions and substitutions needed to turn 'actual' into 'expected'.
+
+    Example:
+    >>> levenshtein_distance("kitten", "sitting")
+    3
+    """
+    if len(actual) < len(expected):
+        actual, expected = expected, actual
+
+    previous = list(range(len(expected) + 1))
+    current = [0] * (len(expected) + 1)
+    for i, actual_item in enumerate(actual, 1):
+        current[0] = i
+        for j, expected_item in enumerate(expected, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (actual_item != expected_item),
+            )
+        previous, current = current, previous
+
+    return previous[-1]
+
+
+def diff_sequences(actual, expected, delimiter: str = ""):
+    """
+    Build the difference string for two strings or lists, computing the distance matrix only where it is needed.
+
+    Equal sequences and sequences where one side is empty are answered directly. Otherwise the common prefix is kept
+    as it is and the Wagner-Fischer matrix is built only for the rest, which for values that differ near the end is a
+    small fraction of the full matrix.
+
+    Only the prefix is stripped: the trace walks back from the end and settles ties towards the end of the
+    sequences, so a common suffix may legitimately take part in the reported edits. Stripping it would change which
+    of the equally short diffs is shown.
+
+    Args:
+    actual (str or list): The actual string or list of elements.
+    expected (str or list): The expected string or list of elements.
+    delimiter (str): The delimiter to use between items in the resulting string.
+
+    Returns:
+    str: The string representing the differences, see reconstruct_string.
+    """
+    actual, expected = _as_sequence(actual), _as_sequence(expected)
+    trivial = _trivial_diff(actual, expected, delimiter)
+    if trivial is not None:
+        return trivial
+
+    prefix = _common_prefix_length(actual, expected)
+    if prefix == 0:
+        matrix = generate_distance_matrix(actual, expected)
+        return reconstruct_string(matrix, actual, expected, delimiter)
+
+    actual_rest, expected_rest = actual[prefix:], expected[prefix:]
+    matrix = generate_distance_matrix(actual_rest, expected_rest)
+    rest = reconstruct_string(matrix, actual_rest, expected_rest, delimiter)
+
+    return delimiter.join([*map(str, actual[:prefix]), rest])
+
+
+def _as_sequence(items):
+    """
+    Return strings, lists and tuples as they are and copy any other sequence (e.g. a numpy array) into a list, so
+    that whole-sequence comparison yields a single bool and items are compared one by one.
+    """
+    if isinstance(items, (str, list, tuple)):
+        return items
+    return list(items)
+
+
+def _trivial_diff(actual, expected, delimiter: str):
+    """
+    Answer the diff of equal sequences, or of sequences where one side is empty, without any matrix.
+
+    Returns:
+    str or None: The difference string, or None when the sequences need the Wagner-Fischer matrix.
+    """
+    if len(actual) == 0:
+        return delimiter.join("+" * len(expected))
+    if len(expected) == 0:
+        return delimiter.join("-" * len(actual))
+    if actual == expected:
+        return delimiter.join(map(str, actual))
+    return None
+
+
+def _common_prefix_length(actual, expected) -> int:
+    """
+    Count the leading items the two sequences have in common.
+    """
+    shortest = min(len(actual), len(expected))
+    prefix = 0
+    while prefix < shortest and actual[prefix] == expected[prefix]:
+        prefix += 1
+    return prefix
+
+
 def string_diff(actual, expected):
     """
     Calculate the string difference between two strings using the Wagner-Fischer algorithm.
@@ -251,8 +453,7 @@ def string_diff(actual, expected):
     Returns:
     str: The string representing the differences with specific symbols ('+', '-', '^').
     """
-    matrix = generate_distance_matrix(actual, expected)
-    return reconstruct_string(matrix, actual, expected)
+    return diff_sequences(actual, expected)
 
 
 def array_diff(actual, expected):
@@ -284,5 +485,4 @@ def array_diff(actual, expected):
     >>> array_diff(actual, expected)
     "[0, 1, ^, +, +]"
     """
-    matrix = generate_distance_matrix(actual, expected)
-    return f"[{reconstruct_string(matrix, actual, expected, ', ')}]"
+    return f"[{diff_sequences(actual, expected, ', ')}]"
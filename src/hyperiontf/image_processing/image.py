@@ -1,5 +1,6 @@
 import uuid
 import os
+from functools import cached_property
 import tempfile
 from typing import Optional
 import base64
@@ -8,6 +9,23 @@ import numpy as np
 from hyperiontf.fs import File
 from hyperiontf.helpers.numeric_helpers import greatest_common_divisor
 
+# counter-clockwise quarter turns -> cv2.rotate code
+_ROTATE_CODES = {
+    1: cv2.ROTATE_90_COUNTERCLOCKWISE,
+    2: cv2.ROTATE_180,
+    3: cv2.ROTATE_90_CLOCKWISE,
+}
+
+
+def _quarter_turns(angle, scale):
+    """
+    Number of counter-clockwise quarter turns (0-3) an unscaled rotation by a multiple of 90 degrees amounts to, None
+    for any other rotation.
+    """
+    if scale != 1.0 or angle % 90:
+        return None
+    return int(angle % 360) // 90
+
 
 class Image(File):
     """
@@ -46,8 +64,8 @@ class Image(File):
         super().__init__(path, mode)
 
         if img_data:
-            # Decode the base64 string to initialize the image
-            image_data = base64.b64decode(img_data.split(",")[-1])
+            # Decode the base64 string to initialize the image, dropping the data URL prefix if there is one
+            image_data = base64.b64decode(img_data.rpartition(",")[2])
             image_array = np.frombuffer(image_data, dtype=np.uint8)
             self._image = cv2.imdecode(image_array, cv2.IMREAD_UNCHANGED)
             if self._image is None:
@@ -69,8 +87,8 @@ class Image(File):
         """
         if not self.exists():
             raise FileNotFoundError("The specified image file does not exist.")
-        self._image = cv2.imread(self.path, cv2.IMREAD_UNCHANGED)
-        if self.image is None:
+        self._set_image(cv2.imread(self.path, cv2.IMREAD_UNCHANGED))
+        if self._image is None:
             raise ValueError(
                 "Unable to load image. The file may be corrupted or in an unsupported format."
             )
@@ -87,17 +105,25 @@ class Image(File):
         Raises:
             ValueError: If the image data is not available or the save path is invalid.
         """
-        if self.image is None:
+        image = self.image
+        if image is None:
             raise ValueError("No image data available to save.")
         save_target = save_path if save_path else self.path
-        cv2.imwrite(save_target, self.image)
+        cv2.imwrite(save_target, image)
 
     def close(self):
         """
         Overrides the File class's close method to clear the loaded image data from memory, ensuring that resources are
         released properly.
         """
-        self._image = None
+        self._set_image(None)
+
+    def _set_image(self, image):
+        """
+        Replaces the loaded image data and drops values cached for the previous image.
+        """
+        self._image = image
+        self.__dict__.pop("aspect_ratio", None)
 
     def display_image(self):
         """
@@ -106,9 +132,10 @@ class Image(File):
         Raises:
             ValueError: If the image data is not available for display.
         """
-        if self.image is None:
+        image = self.image
+        if image is None:
             raise ValueError("No image data available to display.")
-        cv2.imshow("Image", self.image)
+        cv2.imshow("Image", image)
         cv2.waitKey(0)
         cv2.destroyAllWindows()
 
@@ -120,7 +147,8 @@ class Image(File):
         Returns:
             int: The width of the image in pixels, or None if no image is loaded.
         """
-        return self.image.shape[1] if self.image is not None else None
+        image = self.image
+        return image.shape[1] if image is not None else None
 
     @property
     def height(self):
@@ -130,22 +158,26 @@ class Image(File):
         Returns:
             int: The height of the image in pixels, or None if no image is loaded.
         """
-        return self.image.shape[0] if self.image is not None else None
+        image = self.image
+        return image.shape[0] if image is not None else None
 
     @property
     def has_alpha(self):
         return self.image.shape[2] == 4
 
-    @property
+    @cached_property
     def aspect_ratio(self):
         """
         Gets the aspect ratio of the image.
 
+        The value is computed once per loaded image and dropped whenever the image data is replaced
+        (open, close, resize, rotate).
+
         Returns:
             str: The aspect ratio in the format 'width:height', or None if no image is loaded.
                  The aspect ratio is reduced to its simplest form (e.g., 16:9 instead of 1920:1080) using the greatest common divisor.
         """
-        width, height = self.width, self.height
+        height, width = self.image.shape[:2]
         divisor = greatest_common_divisor(width, height)
         simplified_width = width // divisor
         simplified_height = height // divisor
@@ -182,7 +214,9 @@ class Image(File):
 
         return width, height
 
-    def resize(self, width=None, height=None, keep_aspect_ratio=True):
+    def resize(
+        self, width=None, height=None, keep_aspect_ratio=True, interpolation=None
+    ):
         """
         Resizes the image to the given width and height. If keep_aspect_ratio is True, maintains the original aspect ratio,
         adjusting the specified width and height to act as maximum dimensions.
@@ -191,19 +225,38 @@ class Image(File):
             width (int): The target new width of the image. If None and keep_aspect_ratio is False, the original width is maintained.
             height (int): The target new height of the image. If None and keep_aspect_ratio is False, the original height is maintained.
             keep_aspect_ratio (bool): Whether to maintain the original aspect ratio. Defaults to True.
+            interpolation (int): OpenCV interpolation flag to use. By default, cv2.INTER_AREA is used when the image
+                                 shrinks, as it is both faster and sharper for downscaling, and cv2.INTER_LINEAR
+                                 otherwise.
 
         This method modifies the image attribute in-place, resizing the loaded image.
         """
         if width is None and height is None:
             raise ValueError("Either width or height must be specified.")
 
-        if self.image is None:
+        image = self.image
+        if image is None:
             raise ValueError("No image loaded to resize.")
 
         if keep_aspect_ratio:
             width, height = self._calculate_new_dimensions(width, height)
 
-        self._image = cv2.resize(self.image, (width, height))
+        interpolation = self._resize_interpolation(image, width, height, interpolation)
+        self._set_image(cv2.resize(image, (width, height), interpolation=interpolation))
+
+    @staticmethod
+    def _resize_interpolation(image, width, height, interpolation=None):
+        """
+        Return the requested interpolation, or pick one for resizing the image to the given dimensions when none is
+        requested: cv2.INTER_AREA when it shrinks, as it is both faster and sharper for downscaling, and
+        cv2.INTER_LINEAR otherwise.
+        """
+        if interpolation is not None:
+            return interpolation
+        original_height, original_width = image.shape[:2]
+        if width * height < original_width * original_height:
+            return cv2.INTER_AREA
+        return cv2.INTER_LINEAR
 
     def rotate(self, angle, scale=1.0):
         """
@@ -215,19 +268,60 @@ class Image(File):
             scale (float): Isotropic scale factor. If you want to avoid aliasing artifacts, you can use scale factors like 1/2, 1/4, etc.
 
         This method modifies the image attribute in-place, rotating the loaded image according to the given parameters.
+        The canvas keeps the original size. Unscaled rotations by multiples of 90 degrees that fit this canvas (any
+        180 degree turn, or quarter turns of a square image) are done as exact pixel transpositions.
         """
-        if self.image is None:
+        image = self.image
+        if image is None:
             raise ValueError("No image loaded to rotate.")
 
+        if self._rotate_exactly(image, angle, scale):
+            return
+
         # Get the image dimensions, necessary for calculating the rotation matrix
-        (height, width) = self.image.shape[:2]
+        (height, width) = image.shape[:2]
+
         # Get the center of the image to create the rotation matrix
         center = (width / 2, height / 2)
 
         # Calculate the rotation matrix
         rotation_matrix = cv2.getRotationMatrix2D(center, angle, scale)
         # Perform the actual rotation and store the result back in the image attribute
-        self._image = cv2.warpAffine(self.image, rotation_matrix, (width, height))
+        self._set_image(cv2.warpAffine(image, rotation_matrix, (width, height)))
+
+    def _rotate_exactly(self, image, angle, scale) -> bool:
+        """
+        Rotate the image by transposing its pixels when the rotation is an unscaled multiple of 90 degrees that keeps
+        the canvas size, i.e. any 180 degree turn or a quarter turn of a square image. No interpolation is needed then.
+
+        Returns:
+            bool: True when the rotation has been handled, False when it needs the affine transformation.
+        """
+        quarter_turns = _quarter_turns(angle, scale)
+        if quarter_turns is None:
+            return False
+        if quarter_turns == 0:
+            return True
+        (height, width) = image.shape[:2]
+        if quarter_turns != 2 and width != height:
+            return False
+        self._set_image(cv2.rotate(image, _ROTATE_CODES[quarter_turns]))
+        return True
+
+    def to_bytes(self, image_format="PNG"):
+        """
+        Encodes the image into the given format and returns the raw encoded bytes.
+
+        Args:
+            image_format (str): The format to use for encoding the image (e.g., "PNG", "JPEG"). Defaults to "PNG".
+
+        Returns:
+            bytes: The encoded image, e.g. the content of a PNG file.
+
+        This method is useful when the binary form is needed as is, for example as an HTTP request body, without
+        going through base64.
+        """
+        return self._encode(image_format).tobytes()
 
     def to_base64(self, image_format="PNG"):
         """
@@ -242,16 +336,27 @@ class Image(File):
         This method can be useful for embedding the image directly into HTML, storing it in text-based formats,
         or transmitting it over networks where binary data is not suitable.
         """
-        if self.image is None:
+        # base64 output is pure ASCII, decoding it as such skips the UTF-8 validation pass
+        image_base64 = base64.b64encode(self._encode(image_format)).decode("ascii")
+
+        return "data:image/" + image_format.lower() + ";base64," + image_base64
+
+    def _encode(self, image_format):
+        """
+        Encodes the image with OpenCV, shared by to_bytes and to_base64.
+
+        Returns:
+            numpy.ndarray: The encoded image as a uint8 buffer.
+        """
+        image = self.image
+        if image is None:
             raise ValueError("No image loaded to convert.")
 
-        retval, buffer = cv2.imencode(f".{image_format}", self.image)
+        retval, buffer = cv2.imencode(f".{image_format}", image)
         if not retval:
             raise ValueError(f"Could not encode the image to {image_format} format.")
 
-        image_base64 = base64.b64encode(buffer).decode("utf-8")
-
-        return f"data:image/{image_format.lower()};base64,{image_base64}"
+        return buffer
 
     def __repr__(self):
         return f"Image(path='{self.path}', mode='{self.mode}')"
@@ -1,4 +1,5 @@
-from typing import Callable, Dict, List, Any
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Any
 
 
 class EventBroker:
@@ -16,7 +17,7 @@ class EventBroker:
         """
         Initializes a new instance of EventBroker.
         """
-        self._subscribers: Dict[str, List[Callable[[Any], None]]] = {}
+        self._subscribers: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
 
     def subscribe(self, event_type: str, callback: Callable):
         """
@@ -26,17 +27,35 @@ class EventBroker:
         :param callback: The function to call when the event is published. The function
             should take a single argument, which is the data associated with the event.
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
         self._subscribers[event_type].append(callback)
 
     def publish(self, event_type: str, data):
         """
         Publishes an event of the given type to all registered listeners.
 
+        Listeners are taken from a snapshot made before the dispatch starts, so a listener that subscribes another
+        one while handling the event does not change who receives this event.
+
         :param event_type: The type of the event to publish.
         :param data: The data to associate with the event.
         """
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
+        for callback in tuple(self._subscribers.get(event_type, ())):
+            callback(data)
+
+    def publish_many(self, event_type: str, data_items: Iterable):
+        """
+        Publishes a series of events of the same type, one event per item.
+
+        The listeners are looked up once for the whole series, which makes this the preferred way for emitters that
+        produce many events in a row. Listeners subscribed while the series is being published only receive the
+        events of the next publish call.
+
+        :param event_type: The type of the events to publish.
+        :param data_items: The data of each event, in publishing order.
+        """
+        callbacks = tuple(self._subscribers.get(event_type, ()))
+        if not callbacks:
+            return
+        for data in data_items:
+            for callback in callbacks:
                 callback(data)
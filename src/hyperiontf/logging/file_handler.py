@@ -11,8 +11,9 @@ Requirements:
 - Required external modules:
   - logging module for basic logging functionality.
   - io.TextIOWrapper for working with file streams.
-  - shutil module for file manipulation.
+  - functools.cache for keeping the HTML template in memory.
   - os module for file path operations.
+  - threading.Timer for flushing the buffered log stream in the background.
 
 Classes:
 ---------
@@ -20,14 +21,33 @@ FileHandler
 """
 
 import logging
+from functools import cache
 from io import TextIOWrapper
-import shutil
 import os
-from typing import Optional
+import threading
+from typing import Optional, cast
 
 from hyperiontf.helpers.decorators import Singleton
 from .formatter import Formatter
 
+TEMPLATE_PATH = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "assets", "template.html"
+)
+
+# log records are small and dense, let the stream batch them instead of hitting the disk per record
+STREAM_BUFFER_SIZE = 65536
+# longest time, in seconds, a buffered record waits before a background flush writes it to the file
+STREAM_FLUSH_INTERVAL = 1.0
+
+
+@cache
+def _template_content() -> bytes:
+    """
+    Read the HTML log template once, every log file starts with an identical copy of it.
+    """
+    with open(TEMPLATE_PATH, "rb") as template:
+        return template.read()
+
 
 @Singleton
 class FileHandler(logging.FileHandler):
@@ -50,6 +70,7 @@ class FileHandler(logging.FileHandler):
         """
         super().__init__(filename, "a", encoding, True, errors)
         self.setFormatter(Formatter())
+        self._flush_timer: Optional[threading.Timer] = None
 
     def _open(self) -> TextIOWrapper:
         """
@@ -57,16 +78,73 @@ class FileHandler(logging.FileHandler):
         :return:
         """
         self._clone_template()
-        return logging.FileHandler._open(self)
+        return cast(
+            TextIOWrapper,
+            open(
+                self.baseFilename,
+                self.mode,
+                buffering=STREAM_BUFFER_SIZE,
+                encoding=self.encoding,
+                errors=self.errors,
+            ),
+        )
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Write the formatted record to the buffered stream.
+
+        Records at ERROR level or above are flushed right away, this includes the end of folder records, whose level
+        is above CRITICAL. Any other record is flushed by a background timer within STREAM_FLUSH_INTERVAL, so the last
+        records before a hanging or killed test still reach the file without waiting for another record.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+            else:
+                self._schedule_flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _schedule_flush(self):
+        """
+        Start the background flush timer unless one is already pending, called with the handler lock held.
+        """
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(
+                STREAM_FLUSH_INTERVAL, self._flush_scheduled
+            )
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_scheduled(self):
+        """
+        Flush the records buffered since the timer was started, runs on the timer thread.
+        """
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+
+    def close(self):
+        """
+        Cancel the pending background flush and close the stream, which flushes whatever is still buffered.
+        """
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            super().close()
 
     def _clone_template(self):
         """
         Copy the HTML template file to the log file destination, ensuring a consistent layout for HTML logging.
         """
-        shutil.copy(
-            f"{os.path.dirname(os.path.realpath(__file__))}/assets/template.html",
-            self.baseFilename,
-        )
+        with open(self.baseFilename, "wb") as log_file:
+            log_file.write(_template_content())
 
     def init_file(self, new_file: str):
         """
@@ -77,4 +155,8 @@ class FileHandler(logging.FileHandler):
         """
         self.close()  # Close the current file if it's open
         self.baseFilename = os.fspath(new_file)  # Update the file name
-        self._open()  # Reopen the file with the new name
+        self.stream = self._open()  # Reopen the file with the new name
+
+
+# shared instance for the logging package, spares resolving the singleton on every logger creation and log rotation
+file_handler = FileHandler()
@@ -12,10 +12,29 @@ Formatter
 """
 
 import logging
-import html
-import json
-import datetime
-from .log_depth_manager import LogDepthManager
+import time
+from .log_depth_manager import log_depth_manager
+from .helpers import to_json
+
+
+def _escape_html_text(text: str) -> str:
+    """
+    Escape a serialized record for embedding as text content of the log's data element.
+
+    Only '&', '<' and '>' need escaping in text content, quotes are left as they are since JSON output is full of
+    them and the viewer reads the element content back verbatim. Chained str.replace calls use a fast substring
+    search and skip the copy when there is nothing to replace.
+    """
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """
+    Return the record message, plain string messages without arguments are what getMessage would return anyway.
+    """
+    if record.args or type(record.msg) is not str:
+        return record.getMessage()
+    return record.msg
 
 
 class Formatter(logging.Formatter):
@@ -43,74 +62,64 @@ class Formatter(logging.Formatter):
 
         .. versionchanged:: 3.2
            Added the ``style`` parameter.
+
+        `format` builds the record data itself and never uses a format string, so `fmt` and `validate` are accepted
+        for compatibility only and the parent is not asked to parse or validate anything.
         """
         super().__init__(
-            fmt=fmt, datefmt=datefmt, style=style, validate=validate, defaults=defaults
+            fmt=None, datefmt=datefmt, style=style, validate=False, defaults=defaults
         )
-        self._depth_manager = LogDepthManager()
+        self._datefmt = self.datefmt or self.default_time_format
+        # (whole second, formatted text) of the last formatted record, records mostly come in bursts within a second
+        self._formatted_second = (None, "")
+
+    def _format_time_with_milliseconds(self, record: logging.LogRecord) -> str:
+        """
+        Convert the record creation time to a formatted time string with milliseconds.
+
+        The date and time part only changes once a second, so it is formatted once per second and reused, the
+        milliseconds come from the record itself.
+        """
+        second = int(record.created)
+        cached_second, formatted_time = self._formatted_second
+        if second != cached_second:
+            formatted_time = time.strftime(
+                self._datefmt, self.converter(record.created)
+            )
+            self._formatted_second = (second, formatted_time)
+        return f"{formatted_time}.{int(record.msecs)}"
 
-    def _get_basic_log_data(self, record: logging.LogRecord) -> dict:
+    def format(self, record: logging.LogRecord) -> str:
         """
-        Extract the minimum required data from the log record and return it as a dictionary.
+        Format the log record into an HTML-escaped JSON string with additional metadata.
+
+        The mandatory fields are built in a single literal, followed by the optional ones ('key' for metadata
+        records, 'exception', 'assertion' and 'attachments') when the record carries them.
         """
-        return {
+        data = {
             "lvl": record.levelno,
-            "msg": record.getMessage(),
+            "msg": _record_message(record),
             "name": record.name,
-            "time": self._format_time_with_milliseconds(record.created),
-            "depth": self._depth_manager.log_depth,
+            "time": self._format_time_with_milliseconds(record),
+            "depth": log_depth_manager.log_depth,
             "fPath": record.pathname,
             "fLine": record.lineno,
         }
+        self._add_optional_data(data, record)
+        return _escape_html_text(to_json(data))
 
-    def _format_time_with_milliseconds(self, time) -> str:
+    def _add_optional_data(self, data: dict, record: logging.LogRecord):
         """
-        Convert the timestamp to a formatted time string with milliseconds.
-        """
-        datetime_obj = datetime.datetime.fromtimestamp(time)
-        formatted_time = datetime_obj.strftime(self.datefmt or self.default_time_format)
-        milliseconds = int(datetime_obj.microsecond / 1000)
-        return f"{formatted_time}.{milliseconds}"
-
-    @staticmethod
-    def _add_meta_key_to_data(data: dict, record: logging.LogRecord):
-        """
-        Add a 'key' attribute to the data dictionary if the log record has a 'metakey' attribute.
-        """
-        if hasattr(record, "metakey"):
-            data["key"] = record.metakey
+        Add the optional fields the record carries to the log data.
 
-    def _add_exception_info_to_data(self, data: dict, record: logging.LogRecord):
-        """
-        Add an 'exception' attribute with the formatted exception information if the log record has an 'exc_info'
-        attribute.
+        Custom attributes passed through `extra` live in the record's __dict__, so they are read from there directly.
         """
+        extra = record.__dict__
+        if "metakey" in extra:
+            data["key"] = extra["metakey"]
         if record.exc_info:
             data["exception"] = self.formatException(record.exc_info)
-
-    @staticmethod
-    def _add_assertion_to_data(data: dict, record: logging.LogRecord):
-        """
-        Add an 'assertion' attribute to the data dictionary if the log record has an 'assertion' attribute.
-        """
-        if hasattr(record, "assertion"):
-            data["assertion"] = str(record.assertion).lower()
-
-    @staticmethod
-    def _add_attachments_to_data(data: dict, record: logging.LogRecord):
-        """
-        Add an 'attachments' attribute to the data dictionary if the log record has an 'attachments' attribute.
-        """
-        if hasattr(record, "attachments"):
-            data["attachments"] = json.dumps(record.attachments)
-
-    def format(self, record: logging.LogRecord) -> str:
-        """
-        Format the log record into an HTML-escaped JSON string with additional metadata.
-        """
-        data = self._get_basic_log_data(record)
-        self._add_meta_key_to_data(data, record)
-        self._add_exception_info_to_data(data, record)
-        self._add_assertion_to_data(data, record)
-        self._add_attachments_to_data(data, record)
-        return html.escape(json.dumps(data))
+        if "assertion" in extra:
+            data["assertion"] = str(extra["assertion"]).lower()
+        if "attachments" in extra:
+            data["attachments"] = to_json(extra["attachments"])
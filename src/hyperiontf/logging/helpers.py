@@ -5,9 +5,23 @@ Function: Escape Special Characters to HTML Entities
 This function escapes special characters in a given string, converting them to their corresponding HTML entities.
 The escaped characters include backslashes ('\\') and double quotes ('"').
 
+Function: Serialize Log Data to JSON
+====================================
+
+Every log record is serialized to JSON, so the serialization uses orjson when it is installed and falls back to the
+standard json module otherwise. Both produce compact JSON, orjson keeps non-ASCII characters as is while the json
+fallback escapes them, so that lone surrogates never reach the UTF-8 log file.
 """
 
-import html
+import json
+from types import ModuleType
+from typing import Optional
+
+_orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+except ImportError:  # orjson is an optional speedup
+    _orjson = None
 
 
 def escape(text: str) -> str:
@@ -20,4 +34,35 @@ def escape(text: str) -> str:
     :return: The escaped string with special characters converted to HTML entities.
     :rtype: str
     """
-    return html.escape(text.replace("\\", "\\\\").replace('"', '\\"'))
+    # same output as html.escape(text.replace("\\", "\\\\").replace('"', '\\"')), with the quote
+    # escaping folded into a single replacement
+    return (
+        text.replace("\\", "\\\\")
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "\\&quot;")
+        .replace("'", "&#x27;")
+    )
+
+
+def to_json(value) -> str:
+    """
+    Serialize a value to a compact JSON string.
+
+    orjson is used when available. Values it refuses (e.g. integers over 64 bits or strings with lone surrogates) are
+    serialized by the standard json module instead, which is also used when orjson is not installed.
+
+    :param value: The value to serialize.
+
+    :return: The JSON representation of the value.
+    :rtype: str
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value, option=_orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    # ASCII output escapes lone surrogates (e.g. from surrogateescape-decoded output), which the UTF-8 log stream
+    # could not encode
+    return json.dumps(value, separators=(",", ":"))
@@ -51,3 +51,7 @@ class LogDepthManager:
         Reset the logging depth to zero.
         """
         self.log_depth = 0
+
+
+# shared instance for the logging package, spares resolving the singleton every time a logger or formatter is created
+log_depth_manager = LogDepthManager()
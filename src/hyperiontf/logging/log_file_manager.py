@@ -9,44 +9,82 @@ Requirements:
 - Python 3.6 or higher.
 - Required external modules:
   - hyperiontf.configuration for configuration settings.
-  - .file_handler.FileHandler from the same package for log file handling.
+  - .file_handler.file_handler, the shared FileHandler instance from the same package, for log file handling.
   - re module for regular expression operations.
   - os module for file path operations.
 """
 
 from hyperiontf.configuration import config
-from .file_handler import FileHandler
+from .file_handler import file_handler
 import re
 import os
 
+_NONWORD_RE = re.compile(r"\W")
+
+# highest log index reserved per escaped test name, per log folder
+_last_log_indexes: dict[str, dict[str, int]] = {}
+
 
 def generate_test_log_filename(test_name: str) -> str:
     """
     Generate a test-specific log filename based on the provided test name.
 
-    The generated filename includes the test name and an index, if necessary, to ensure uniqueness in case multiple tests
-    have the same name.
+    The generated filename includes the test name and an index, following the highest index already present in the log
+    folder, to ensure uniqueness in case multiple tests have the same name. The file is created empty to reserve the
+    name, so processes sharing the log folder never pick the same one.
 
     :param test_name: The name of the test for which the log file needs to be generated.
     :type test_name: str
 
-    :return: The generated test-specific log filename.
+    :return: The generated, already created, test-specific log filename.
     :rtype: str
     """
-    index = 0
-    escaped_test_name = re.sub(r"\W", "_", test_name)
+    escaped_test_name = _NONWORD_RE.sub("_", test_name)
+    log_folder = config.logger.ensure_log_folder_ready()
+    return _claim_log_file(log_folder, escaped_test_name)
 
-    def generate_name():
-        return (
-            f"{os.getcwd()}/{config.logger.log_folder}/{escaped_test_name}-{index}.html"
-        )
 
-    filename = generate_name()
-    while os.path.exists(filename):
-        index += 1
-        filename = generate_name()
+def _claim_log_file(log_folder: str, escaped_test_name: str) -> str:
+    """
+    Create the log file under the first free index, starting right after the highest index known for the test.
+
+    The log folder is scanned once per process and the cached indexes are only a starting hint: the file is created
+    exclusively, so when another process sharing the folder already took an index, the next one is tried instead.
+    """
+    last_indexes = _last_log_indexes.get(log_folder)
+    if last_indexes is None:
+        last_indexes = _last_log_indexes[log_folder] = _scan_log_indexes(log_folder)
+    index = last_indexes.get(escaped_test_name, -1) + 1
+    while True:
+        filename = f"{log_folder}/{escaped_test_name}-{index}.html"
+        try:
+            open(filename, "xb").close()
+        except FileExistsError:
+            index += 1
+            continue
+        last_indexes[escaped_test_name] = index
+        return filename
 
-    return filename
+
+def _scan_log_indexes(log_folder: str) -> dict[str, int]:
+    """
+    Collect the highest log index per escaped test name from a single directory pass.
+
+    Escaped test names never contain '-', so the index is whatever follows the last '-' of a '.html' file name.
+    """
+    suffix = ".html"
+    last_indexes: dict[str, int] = {}
+    with os.scandir(log_folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(suffix):
+                continue
+            escaped_test_name, separator, index = name[: -len(suffix)].rpartition("-")
+            if separator and index.isdecimal():
+                last_indexes[escaped_test_name] = max(
+                    last_indexes.get(escaped_test_name, -1), int(index)
+                )
+    return last_indexes
 
 
 def init_test_log(test_name: str):
@@ -59,4 +97,4 @@ def init_test_log(test_name: str):
     :param test_name: The name of the test for which the log file needs to be initialized.
     :type test_name: str
     """
-    FileHandler().init_file(generate_test_log_filename(test_name))
+    file_handler.init_file(generate_test_log_filename(test_name))
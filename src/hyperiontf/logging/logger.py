@@ -9,7 +9,7 @@ Requirements:
 --------------
 - Python 3.6 or higher.
 - Required external modules:
-  - json module for working with JSON data.
+  - .helpers.to_json from the same package for serializing metadata to JSON.
   - logging module for basic logging functionality.
   - os module for file path operations.
   - re module for regular expression operations.
@@ -21,12 +21,12 @@ Classes:
 Logger
 """
 
-import json
 import logging
 from typing import Optional, cast
 
-from .file_handler import FileHandler as HyperionFileHandler
-from .log_depth_manager import LogDepthManager
+from .file_handler import file_handler
+from .helpers import to_json
+from .log_depth_manager import log_depth_manager
 from .log_file_manager import generate_test_log_filename
 
 END_OF_FOLDER_LEVEL = 10000
@@ -58,8 +58,8 @@ class Logger(logging.Logger):
         :type level: int
         """
         super().__init__(name, level)
-        self._depth_manager = LogDepthManager()
-        self._file_handler = HyperionFileHandler()
+        self._depth_manager = log_depth_manager
+        self._file_handler = file_handler
         self.addHandler(self._file_handler)
 
     def push_folder(self, message: Optional[str] = None):
@@ -82,7 +82,34 @@ class Logger(logging.Logger):
         :param value: The value of the metadata.
         :type value: Any
         """
-        self.debug(json.dumps(value), extra={"metakey": key})
+        self.debug(to_json(value), extra={"metakey": key})
+
+    def add_metas(self, **metas):
+        """
+        Log several metadata values at once.
+
+        The log level check and the caller lookup are done once for the whole batch, each value is still written as
+        its own metadata record.
+
+        :param metas: Metadata values keyed by metadata key.
+        """
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        fn, lno, func, sinfo = self.findCaller()
+        for key, value in metas.items():
+            record = self.makeRecord(
+                self.name,
+                logging.DEBUG,
+                fn,
+                lno,
+                to_json(value),
+                None,
+                None,
+                func,
+                {"metakey": key},
+                sinfo,
+            )
+            self.handle(record)
 
     def pop_folder(self):
         """
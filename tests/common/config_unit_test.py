@@ -0,0 +1,117 @@
+import json
+
+import pytest
+from hyperiontf.configuration import config
+from hyperiontf.configuration.config import Config
+from hyperiontf.configuration.sections import Logger, Rest, Visual
+from hyperiontf.typing import VisualMode
+
+
+@pytest.fixture
+def restore_rest_section():
+    original = config.rest.to_dict()
+    yield config.rest
+    config.rest.from_cfg_node(original)
+    config.invalidate_cache()
+
+
+@pytest.mark.Config
+def test_config_is_singleton():
+    assert Config() is config
+
+
+@pytest.mark.Config
+def test_unknown_section_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        config.not_a_section  # noqa: B018
+
+
+@pytest.mark.Config
+def test_from_cfg_node_applies_known_fields_only():
+    rest = Rest()
+    rest.from_cfg_node(
+        {"request_timeout": 99, "connection_timeout": None, "unknown_key": 1}
+    )
+    assert rest.request_timeout == 99
+    assert rest.connection_timeout == 10
+    assert not hasattr(rest, "unknown_key")
+
+
+@pytest.mark.Config
+def test_from_cfg_node_skips_empty_nodes():
+    rest = Rest()
+    rest.from_cfg_node(None)
+    rest.from_cfg_node({})
+    assert rest.to_dict() == Rest().to_dict()
+
+
+@pytest.mark.Config
+def test_to_dict_is_invalidated_on_assignment():
+    rest = Rest()
+    snapshot = rest.to_dict()
+    snapshot["request_timeout"] = 5
+    assert rest.to_dict()["request_timeout"] == 30
+    rest.request_timeout = 1
+    assert rest.to_dict()["request_timeout"] == 1
+    assert snapshot["request_timeout"] == 5
+
+
+@pytest.mark.Config
+def test_visual_mode_is_normalized():
+    visual = Visual()
+    visual.from_cfg_node({"mode": " Collect "})
+    assert visual.mode is VisualMode.COLLECT
+    assert visual.to_dict()["mode"] == VisualMode.COLLECT
+    with pytest.raises(ValueError):
+        visual.mode = "unknown"
+
+
+@pytest.mark.Config
+def test_config_file_is_reparsed_only_when_changed(tmp_path, restore_rest_section):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text(json.dumps({"rest": {"request_timeout": 11}}))
+
+    config.update_from_cfg_file(str(cfg_file))
+    assert restore_rest_section.request_timeout == 11
+    cached = config._parsed_cache[str(cfg_file)]
+
+    config.update_from_cfg_file(str(cfg_file))
+    assert config._parsed_cache[str(cfg_file)] is cached
+
+    cfg_file.write_text(json.dumps({"rest": {"request_timeout": 120}}))
+    config.update_from_cfg_file(str(cfg_file))
+    assert restore_rest_section.request_timeout == 120
+
+
+@pytest.mark.Config
+def test_cfg_and_empty_yaml_files(tmp_path, restore_rest_section):
+    cfg_file = tmp_path / "config.cfg"
+    cfg_file.write_text("[rest]\nrequest_timeout = 12\n")
+    empty_file = tmp_path / "empty.yaml"
+    empty_file.write_text("")
+
+    config.update_from_cfg_file(str(cfg_file))
+    config.update_from_cfg_file(str(empty_file))
+    assert restore_rest_section.request_timeout == "12"
+
+
+@pytest.mark.Config
+def test_config_file_accepts_path_objects(tmp_path, restore_rest_section):
+    cfg_file = tmp_path / "config.json"
+    cfg_file.write_text(json.dumps({"rest": {"request_timeout": 13}}))
+
+    config.update_from_cfg_file(cfg_file)
+    assert restore_rest_section.request_timeout == 13
+    assert str(cfg_file) in config._parsed_cache
+
+
+@pytest.mark.Config
+def test_log_folder_keeps_configured_value(tmp_path, monkeypatch):
+    logger = Logger()
+    assert logger.to_dict()["log_folder"] == "logs"
+
+    monkeypatch.chdir(tmp_path)
+    assert logger.ensure_log_folder_ready() == str(tmp_path / "logs")
+    monkeypatch.chdir(tmp_path / "logs")
+    assert logger.ensure_log_folder_ready() == str(tmp_path / "logs" / "logs")
+    assert logger.log_folder == "logs"
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+from hyperiontf.helpers.wagner_fischer import (
+    array_diff,
+    levenshtein_distance,
+    string_diff,
+)
+
+
+@pytest.mark.differences
+@pytest.mark.parametrize(
+    "actual, expected, distance",
+    [
+        ("kitten", "sitting", 3),
+        ("sitting", "kitten", 3),
+        ("", "abc", 3),
+        ("abc", "", 3),
+        ("same", "same", 0),
+        ([0, 1, 2, 3], [0, 1, 3, 4], 2),
+    ],
+)
+def test_levenshtein_distance(actual, expected, distance):
+    assert levenshtein_distance(actual, expected) == distance
+
+
+@pytest.mark.differences
+def test_string_diff():
+    assert string_diff("Hello", "World") == "^^^l^"
+    assert string_diff("abc", "abc") == "abc"
+    assert string_diff("", "ab") == "++"
+    assert string_diff("ab", "") == "--"
+
+
+@pytest.mark.differences
+def test_array_diff():
+    assert array_diff([1, 2, 3], [4, 5, 6]) == "[^, ^, ^]"
+    assert array_diff([0, 1, 2, 3], [0, 1, 3, 4]) == "[0, 1, -, 3, +]"
+    assert array_diff([], [1]) == "[+]"
+
+
+@pytest.mark.differences
+def test_array_diff_of_numpy_arrays():
+    assert array_diff(np.array([1, 2, 3]), np.array([1, 2, 4])) == "[1, 2, ^]"
+    assert array_diff(np.array([1, 2]), np.array([1, 2])) == "[1, 2]"